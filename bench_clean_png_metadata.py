@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark for clean_png_metadata.py
+Times full CLI runs over generated PNG batches for several --jobs values, so
+the thread pool can be compared against sequential processing (--jobs 1).
+
+Usage:
+  python bench_clean_png_metadata.py [--small N] [--large N] [--large-mb MB]
+                                     [--repeat N] [--jobs N [N ...]]
+
+Notes:
+  - No third-party libraries; only Python standard library.
+  - Every case is run once untimed first, so timings are for a warm page cache.
+  - Output goes to a fresh directory per run; the best of --repeat runs is reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import binascii
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import List
+
+from clean_png_metadata import MAX_WORKERS, PNG_SIGNATURE
+
+SCRIPT = Path(__file__).resolve().parent / "clean_png_metadata.py"
+
+
+def make_chunk(type_bytes: bytes, data: bytes) -> bytes:
+    crc = binascii.crc32(type_bytes + data) & 0xFFFFFFFF
+    return struct.pack(">I", len(data)) + type_bytes + data + struct.pack(">I", crc)
+
+
+def make_png(width: int, height: int, idat: bytes) -> bytes:
+    """An RGB PNG carrying the usual metadata chunks around the given IDAT payload."""
+    return PNG_SIGNATURE + b"".join([
+        make_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+        make_chunk(b"gAMA", struct.pack(">I", 45455)),
+        make_chunk(b"pHYs", struct.pack(">IIB", 2835, 2835, 1)),
+        make_chunk(b"tEXt", b"Software\x00bench_clean_png_metadata"),
+        make_chunk(b"IDAT", idat),
+        make_chunk(b"tIME", struct.pack(">HBBBBB", 2024, 1, 1, 0, 0, 0)),
+        make_chunk(b"IEND", b""),
+    ])
+
+
+def generate(root: Path, small: int, large: int, large_mb: int) -> List[Path]:
+    """Write the small and large batches under root; returns the batch directories."""
+    batches = []
+    if small:
+        small_dir = root / "small"
+        small_dir.mkdir()
+        idat = zlib.compress(b"".join(b"\x00" + os.urandom(16 * 3) for _ in range(16)))
+        data = make_png(16, 16, idat)
+        for i in range(small):
+            (small_dir / f"{i:05d}.png").write_bytes(data)
+        batches.append(small_dir)
+    if large:
+        large_dir = root / "large"
+        large_dir.mkdir()
+        # Random bytes stand in for compressed image data; the cleaner never inflates IDAT
+        for i in range(large):
+            (large_dir / f"{i:03d}.png").write_bytes(make_png(1024, 1024, os.urandom(large_mb * 1024 * 1024)))
+        batches.append(large_dir)
+    return batches
+
+
+def run_once(batch: Path, out_dir: Path, jobs: int) -> float:
+    shutil.rmtree(out_dir, ignore_errors=True)
+    cmd = [sys.executable, str(SCRIPT), "-i", str(batch), "-o", str(out_dir), "--jobs", str(jobs)]
+    start = time.perf_counter()
+    # cwd is the scratch dir so the run's notepad entry lands there, not in the repo
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, cwd=str(batch.parent))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark clean_png_metadata.py across --jobs values.")
+    parser.add_argument("--small", type=int, default=4000, help="Number of small PNGs (about 300 bytes each).")
+    parser.add_argument("--large", type=int, default=16, help="Number of large PNGs.")
+    parser.add_argument("--large-mb", type=int, default=8, help="IDAT size of each large PNG in MiB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is reported.")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, MAX_WORKERS], help="--jobs values to compare.")
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, cpu_count={os.cpu_count()}, MAX_WORKERS={MAX_WORKERS}")
+    with tempfile.TemporaryDirectory(prefix="bench_png_") as tmp:
+        root = Path(tmp)
+        batches = generate(root, args.small, args.large, args.large_mb)
+        for batch in batches:
+            n_files = len(os.listdir(batch))
+            for jobs in args.jobs:
+                out_dir = root / "out"
+                run_once(batch, out_dir, jobs)  # warm-up
+                best = min(run_once(batch, out_dir, jobs) for _ in range(args.repeat))
+                print(f"{batch.name:>6} x{n_files:<5} --jobs {jobs:<3} {best:7.3f}s  {n_files / best:9.0f} files/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,8 @@ Keeps core chunks IHDR, PLTE, IDAT, IEND. Other non-metadata chunks are preserve
 
 Usage:
   python clean_png_metadata.py --input <DIR|FILE> [--output <DIR|FILE>]
-                               [--recursive] [--backup] [--dry-run]
+                               [--recursive] [--backup] [--dry-run] [--verify-crc]
+                               [--jobs N]
 
 Options:
   --input       Path to a PNG file or a directory containing PNGs.
@@ -17,6 +18,8 @@ Options:
   --recursive   Recursively process subdirectories (when --input is a directory).
   --backup      Create a .bak copy beside the original PNGs before overwriting.
   --dry-run     Do not write any files. Just show what would be done.
+  --verify-crc  Recompute and check the CRC of every chunk while reading (off by default).
+  --jobs        Number of files processed in parallel (default 1: sequential, no thread pool).
 
 Notes:
   - No third-party libraries; only Python standard library.
@@ -29,27 +32,74 @@ from __future__ import annotations
 
 import argparse
 import binascii
+import mmap
 import os
 import shutil
 import sys
+import tempfile
 import time
-from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import BinaryIO, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 
 
 # ----------------------------
 # PNG chunk data structure
 # ----------------------------
+# Explicit __slots__ (rather than dataclass(slots=True), which needs Python 3.10)
+# drops the per-instance __dict__; PNGs can have thousands of chunks.
 @dataclass
 class PNGChunk:
-    length: int
-    type: str  # 4-char ASCII
-    data: bytes
-    crc: int
+    __slots__ = ("len_bytes", "type", "data", "crc_bytes")
+
+    len_bytes: bytes  # original big-endian length field
+    type: bytes  # 4-byte chunk type, e.g. b"IDAT"
+    data: bytes  # may be a memoryview slice of the whole-file buffer
+    crc_bytes: bytes  # original big-endian CRC, written back verbatim
+
+    @property
+    def length(self) -> int:
+        return int.from_bytes(self.len_bytes, "big")
+
+    @property
+    def crc(self) -> int:
+        return int.from_bytes(self.crc_bytes, "big")
+
+    def __repr__(self) -> str:
+        return f"<Chunk {chunk_name(self.type)} len={self.length} crc=0x{self.crc:08X}>"
+
+
+@dataclass
+class PNGChunkRef:
+    """
+    A chunk whose payload is left in the source file.
+    The payload is streamed from src_path at data_offset when writing.
+    """
+    __slots__ = ("src_path", "data_offset", "len_bytes", "type", "crc_bytes")
+
+    src_path: Path
+    data_offset: int
+    len_bytes: bytes  # original big-endian length field
+    type: bytes  # 4-byte chunk type, e.g. b"IDAT"
+    crc_bytes: bytes  # original big-endian CRC, written back verbatim
+
+    @property
+    def length(self) -> int:
+        return int.from_bytes(self.len_bytes, "big")
 
     def __repr__(self) -> str:
-        return f"<Chunk {self.type} len={self.length} crc=0x{self.crc:08X}>"
+        return f"<ChunkRef {chunk_name(self.type)} len={self.length} offset={self.data_offset} crc=0x{self.crc_bytes.hex().upper()}>"
+
+
+Chunk = Union[PNGChunk, PNGChunkRef]
+
+
+def chunk_name(type_bytes: bytes) -> str:
+    # Chunk types are kept as raw bytes; decode only for display
+    return type_bytes.decode("ascii", errors="replace")
 
 
 # ----------------------------
@@ -59,69 +109,267 @@ class PNGChunk:
 PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
 
+class NotPNGError(ValueError):
+    """Raised when a file does not start with the PNG signature."""
+
+# Buffer size used when streaming chunk payloads and for the output file
+COPY_BUFSIZE = 1024 * 1024
+
+# Files up to this size are read and parsed in one shot instead of streamed
+SMALL_FILE_BYTES = COPY_BUFSIZE
+
+# In larger files, only chunks with payloads above this size (typically IDAT) are
+# left on disk as PNGChunkRef; smaller ones are read while scanning
+STREAM_MIN_BYTES = 64 * 1024
+
 def compute_crc(type_bytes: bytes, data: bytes) -> int:
-    # CRC is CRC-32 of chunk type + chunk data
-    return binascii.crc32(type_bytes + data) & 0xFFFFFFFF
+    # CRC is CRC-32 of chunk type + chunk data (folded incrementally, no concatenation)
+    return binascii.crc32(data, binascii.crc32(type_bytes)) & 0xFFFFFFFF
+
 
+def _check_crc(file_path: Path, type_bytes: bytes, crc_bytes: bytes, expected_crc: int) -> None:
+    crc = int.from_bytes(crc_bytes, "big")
+    if crc != expected_crc:
+        raise ValueError(
+            f"CRC mismatch for chunk {chunk_name(type_bytes)} in {file_path}: "
+            f"expected 0x{expected_crc:08X}, got 0x{crc:08X}"
+        )
 
-def read_png_chunks(file_path: Path) -> List[PNGChunk]:
+
+def _parse_png_buffer(buf: bytes, file_path: Path, verify_crc: bool) -> Tuple[List[Chunk], int]:
+    """
+    Parse all chunks of a PNG held in memory, checking CRCs if verify_crc is True.
+    Chunk data are memoryview slices of buf, so no payload is copied.
+    Returns (chunks, total_data_bytes).
     """
-    Read all chunks from a PNG file, validating the signature and CRCs.
-    Returns a list of PNGChunk.
+    mv = memoryview(buf)
+    if mv[:8] != PNG_SIGNATURE:
+        raise NotPNGError(f"Not a valid PNG file: {file_path}")
+
+    chunks: List[Chunk] = []
+    total_data_bytes = 0
+    end = len(mv)
+    pos = 8
+    while pos < end:
+        if pos + 4 > end:
+            raise ValueError(f"Unexpected EOF while reading length in {file_path}")
+        len_bytes = bytes(mv[pos:pos + 4])
+        length = int.from_bytes(len_bytes, "big")
+
+        if pos + 8 > end:
+            raise ValueError(f"Unexpected EOF while reading type in {file_path}")
+        type_bytes = bytes(mv[pos + 4:pos + 8])
+
+        data_end = pos + 8 + length
+        if data_end > end:
+            raise ValueError(f"Unexpected EOF while reading data for {chunk_name(type_bytes)} in {file_path}")
+        data = mv[pos + 8:data_end]
+
+        if data_end + 4 > end:
+            raise ValueError(f"Unexpected EOF while reading CRC for {chunk_name(type_bytes)} in {file_path}")
+        crc_bytes = bytes(mv[data_end:data_end + 4])
+
+        # CRC check (optional)
+        if verify_crc:
+            _check_crc(file_path, type_bytes, crc_bytes, compute_crc(type_bytes, data))
+
+        chunks.append(PNGChunk(len_bytes=len_bytes, type=type_bytes, data=data, crc_bytes=crc_bytes))
+        total_data_bytes += length
+        pos = data_end + 4
+    return chunks, total_data_bytes
+
+
+def read_png_chunks(file_path: Path, verify_crc: bool = False) -> Tuple[List[Chunk], int]:
     """
-    chunks: List[PNGChunk] = []
+    Read all chunks from a PNG file, validating the signature.
+    Small files (up to SMALL_FILE_BYTES) are read in one call and returned as
+    PNGChunk objects holding slices of that buffer. In larger files, payloads above
+    STREAM_MIN_BYTES are returned as PNGChunkRef references into file_path (and, with
+    verify_crc, CRC-checked in COPY_BUFSIZE pieces rather than held in memory);
+    smaller chunks are read into PNGChunk objects.
+    CRCs are checked only if verify_crc is True.
+    Returns (chunks, total_data_bytes), the latter being the sum of chunk lengths.
+    """
+    chunks: List[Chunk] = []
+    total_data_bytes = 0
     with file_path.open("rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size <= SMALL_FILE_BYTES:
+            return _parse_png_buffer(f.read(), file_path, verify_crc)
+
         sig = f.read(8)
         if sig != PNG_SIGNATURE:
-            raise ValueError(f"Not a valid PNG file: {file_path}")
+            raise NotPNGError(f"Not a valid PNG file: {file_path}")
 
         while True:
-            len_bytes = f.read(4)
-            if not len_bytes:
+            # Length and type in a single read
+            header = f.read(8)
+            if not header:
                 break  # EOF
-            if len(len_bytes) != 4:
+            if len(header) < 4:
                 raise ValueError(f"Unexpected EOF while reading length in {file_path}")
-
-            length = int.from_bytes(len_bytes, "big")
-
-            type_bytes = f.read(4)
-            if len(type_bytes) != 4:
+            if len(header) != 8:
                 raise ValueError(f"Unexpected EOF while reading type in {file_path}")
-            chunk_type = type_bytes.decode("ascii", errors="replace")
 
-            data = f.read(length)
-            if len(data) != length:
-                raise ValueError(f"Unexpected EOF while reading data for {chunk_type} in {file_path}")
+            len_bytes = header[:4]
+            type_bytes = header[4:]
+            length = int.from_bytes(len_bytes, "big")
+            total_data_bytes += length
+
+            if length <= STREAM_MIN_BYTES:
+                # Small chunk: payload and CRC in a single read
+                body = f.read(length + 4)
+                if len(body) < length:
+                    raise ValueError(f"Unexpected EOF while reading data for {chunk_name(type_bytes)} in {file_path}")
+                if len(body) != length + 4:
+                    raise ValueError(f"Unexpected EOF while reading CRC for {chunk_name(type_bytes)} in {file_path}")
+                data = memoryview(body)[:length]
+                crc_bytes = body[length:]
+                if verify_crc:
+                    _check_crc(file_path, type_bytes, crc_bytes, compute_crc(type_bytes, data))
+                chunks.append(PNGChunk(len_bytes=len_bytes, type=type_bytes, data=data, crc_bytes=crc_bytes))
+                continue
 
+            # Large payload: left on disk and streamed from the source on write
+            data_offset = f.tell()
+            if data_offset + length > file_size:
+                raise ValueError(f"Unexpected EOF while reading data for {chunk_name(type_bytes)} in {file_path}")
+            if verify_crc:
+                # Fold the CRC over bounded reads instead of loading the payload
+                running = binascii.crc32(type_bytes)
+                remaining = length
+                while remaining:
+                    buf = f.read(min(remaining, COPY_BUFSIZE))
+                    if not buf:
+                        raise ValueError(f"Unexpected EOF while reading data for {chunk_name(type_bytes)} in {file_path}")
+                    running = binascii.crc32(buf, running)
+                    remaining -= len(buf)
+            else:
+                f.seek(length, 1)
             crc_bytes = f.read(4)
             if len(crc_bytes) != 4:
-                raise ValueError(f"Unexpected EOF while reading CRC for {chunk_type} in {file_path}")
-            crc = int.from_bytes(crc_bytes, "big")
-
-            # CRC check
-            expected_crc = compute_crc(type_bytes, data)
-            if crc != expected_crc:
-                raise ValueError(
-                    f"CRC mismatch for chunk {chunk_type} in {file_path}: "
-                    f"expected 0x{expected_crc:08X}, got 0x{crc:08X}"
+                raise ValueError(f"Unexpected EOF while reading CRC for {chunk_name(type_bytes)} in {file_path}")
+            if verify_crc:
+                _check_crc(file_path, type_bytes, crc_bytes, running & 0xFFFFFFFF)
+            chunks.append(
+                PNGChunkRef(
+                    src_path=file_path,
+                    data_offset=data_offset,
+                    len_bytes=len_bytes,
+                    type=type_bytes,
+                    crc_bytes=crc_bytes,
                 )
+            )
+    return chunks, total_data_bytes
+
+
+def _copy_range(fsrc: BinaryIO, fdst: BinaryIO, offset: int, length: int) -> None:
+    """
+    Copy exactly length bytes starting at offset from fsrc to fdst.
+    """
+    fsrc.seek(offset)
+    remaining = length
+    while remaining:
+        buf = fsrc.read(min(remaining, COPY_BUFSIZE))
+        if not buf:
+            raise ValueError(f"Unexpected EOF while copying chunk data from {fsrc.name}")
+        fdst.write(buf)
+        remaining -= len(buf)
 
-            chunks.append(PNGChunk(length=length, type=chunk_type, data=data, crc=crc))
-    return chunks
+
+def _open_source(path: Path) -> Tuple[BinaryIO, Optional[mmap.mmap]]:
+    """
+    Open a chunk source file and map it read-only with sequential read-ahead.
+    The map is None if the file cannot be mapped; callers then fall back to reads.
+    """
+    fsrc = path.open("rb")
+    try:
+        mm = mmap.mmap(fsrc.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return fsrc, None
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return fsrc, mm
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
 
 
-def write_png_chunks(chunks: List[PNGChunk], dest_path: Path) -> int:
+@contextmanager
+def _atomic_output(dest_path: Path, buffering: int = -1) -> Iterator[BinaryIO]:
+    """
+    Open a binary file that becomes dest_path when the block exits cleanly.
+    An existing dest_path is never truncated: data go to a uniquely named temporary
+    file beside it, which takes over its mode and atomically replaces it, or is
+    removed if the block raises. A new dest_path is written directly.
+    """
+    if not dest_path.exists():
+        with dest_path.open("wb", buffering=buffering) as f:
+            yield f
+        return
+
+    fd, tmp_name = tempfile.mkstemp(dir=dest_path.parent, prefix=dest_path.name, suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb", buffering=buffering) as f:
+            yield f
+        shutil.copymode(dest_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_png_chunks(chunks: List[Chunk], dest_path: Path) -> int:
     """
     Write PNG header + kept chunks to dest_path.
+    PNGChunkRef payloads are written straight from a read-only mmap of their
+    source file (falling back to buffered reads if it cannot be mapped).
+    An existing dest_path is replaced atomically (see _atomic_output), which also
+    keeps the source readable while writing in-place.
     Returns the size of the written file in bytes.
     """
-    with dest_path.open("wb") as f:
-        f.write(PNG_SIGNATURE)
-        for ch in chunks:
-            f.write(ch.length.to_bytes(4, "big"))
-            f.write(ch.type.encode("ascii"))
-            f.write(ch.data)
-            f.write(ch.crc.to_bytes(4, "big"))
+    sources: Dict[Path, Tuple[BinaryIO, Optional[mmap.mmap]]] = {}
+    # Batch in-memory pieces and mmap slices, handed over in a single writelines call
+    parts: List[bytes] = [PNG_SIGNATURE]
+    with _atomic_output(dest_path, buffering=COPY_BUFSIZE) as f:
+        try:
+            for ch in chunks:
+                parts.append(ch.len_bytes)
+                parts.append(ch.type)
+                if isinstance(ch, PNGChunkRef):
+                    source = sources.get(ch.src_path)
+                    if source is None:
+                        source = sources[ch.src_path] = _open_source(ch.src_path)
+                    fsrc, mm = source
+                    if mm is not None:
+                        data_end = ch.data_offset + ch.length
+                        if data_end > len(mm):
+                            raise ValueError(f"Unexpected EOF while copying chunk data from {ch.src_path}")
+                        parts.append(memoryview(mm)[ch.data_offset:data_end])
+                    else:
+                        f.writelines(parts)
+                        parts.clear()
+                        _copy_range(fsrc, f, ch.data_offset, ch.length)
+                else:
+                    parts.append(ch.data)
+                parts.append(ch.crc_bytes)
+            f.writelines(parts)
+        finally:
+            # Sources are closed before the output replaces dest_path (which may be
+            # one of them); views into the maps must be gone before the maps can close
+            parts.clear()
+            for fsrc, mm in sources.values():
+                if mm is not None:
+                    mm.close()
+                fsrc.close()
     return dest_path.stat().st_size
 
 
@@ -130,30 +378,32 @@ def write_png_chunks(chunks: List[PNGChunk], dest_path: Path) -> int:
 # ----------------------------
 
 # Chunks that must be preserved as core image data
-CORE_CHUNKS = {"IHDR", "PLTE", "IDAT", "IEND"}
+CORE_CHUNKS: FrozenSet[bytes] = frozenset({b"IHDR", b"PLTE", b"IDAT", b"IEND"})
 
 # Chunk types to drop (metadata)
-DROP_CHUNKS: Set[str] = {"tEXt", "zTXt", "iTXt", "tIME", "pHYs", "gAMA"}
+DROP_CHUNKS: FrozenSet[bytes] = frozenset({b"tEXt", b"zTXt", b"iTXt", b"tIME", b"pHYs", b"gAMA"})
 
 
-def filter_chunks(chunks: List[PNGChunk]) -> Tuple[List[PNGChunk], int]:
+def filter_chunks(chunks: List[Chunk]) -> Tuple[List[Chunk], int, int]:
     """
     Filter chunks: keep core chunks; drop known metadata chunks.
-    Returns (kept_chunks, removed_count).
+    Returns (kept_chunks, removed_count, kept_data_bytes).
     Other non-metadata chunks are preserved as-is to avoid data loss.
     """
-    kept: List[PNGChunk] = []
+    kept: List[Chunk] = []
     removed = 0
+    kept_data_bytes = 0
     for ch in chunks:
         if ch.type in CORE_CHUNKS:
             kept.append(ch)
         elif ch.type in DROP_CHUNKS:
             removed += 1
-            # drop
+            continue  # drop
         else:
             # keep other non-core chunks to preserve information (e.g., sRGB, iCCP, etc.)
             kept.append(ch)
-    return kept, removed
+        kept_data_bytes += ch.length
+    return kept, removed, kept_data_bytes
 
 
 # ----------------------------
@@ -164,7 +414,9 @@ def collect_png_files(input_path: Path, recursive: bool) -> List[Path]:
     """
     Returns a list of PNG file paths to process.
     If input_path is a file, returns [input_path].
-    If a directory, returns all PNGs (.png, .PNG) according to recursion flag.
+    If a directory, returns all PNGs (.png, .PNG, any case) according to recursion flag.
+    Signatures are not checked here; read_png_chunks raises NotPNGError for
+    mislabeled files, which are then reported as skipped.
     """
     if input_path.is_file():
         if input_path.suffix.lower() == ".png":
@@ -174,13 +426,96 @@ def collect_png_files(input_path: Path, recursive: bool) -> List[Path]:
     if not input_path.exists():
         return []
 
-    if recursive:
-        files = sorted(input_path.rglob("*.png"))
-        files += sorted(input_path.rglob("*.PNG"))
-    else:
-        files = sorted(input_path.glob("*.png"))
-        files += sorted(input_path.glob("*.PNG"))
-    return [p for p in files if p.is_file()]
+    return sorted(Path(p) for p in _scan_png_files(str(input_path), recursive))
+
+
+def _scan_png_files(directory: str, recursive: bool) -> Iterator[str]:
+    """
+    Yield paths of regular files ending in .png (any case) in a single pass.
+    os.scandir reuses the directory entry type, so no per-file stat() is needed.
+    Unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)  # release the directory handle before recursing
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                yield from _scan_png_files(entry.path, recursive)
+        elif entry.name.lower().endswith(".png") and entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def copy_file_fast(src: Path, dest: Path) -> None:
+    """
+    Copy src to dest byte-for-byte; an existing dest is replaced atomically.
+    Uses os.copy_file_range (Linux) so the data stays in the kernel;
+    falls back to a buffered copy where unavailable or unsupported.
+    """
+    with src.open("rb") as fsrc, _atomic_output(dest) as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        if hasattr(os, "copy_file_range") and size > 0:
+            try:
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        if remaining == size:
+                            break  # nothing copied: unsupported for this file, use plain reads
+                        raise ValueError(f"Unexpected EOF while copying {src}")
+                    remaining -= copied
+                else:
+                    return
+            except OSError:
+                # e.g. cross-device copy on older kernels; restart with plain reads
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+
+
+# Number of upcoming files hinted for kernel read-ahead during a batch
+PREFETCH_WINDOW = 32
+
+
+def prefetch_file(path: Path) -> None:
+    """
+    Ask the kernel to start reading path into the page cache in the background
+    (posix_fadvise WILLNEED). No-op where unsupported.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def resolve_dest(src: Path, input_path: Path, output_path: Optional[Path]) -> Path:
+    """
+    Destination for src: src itself when no output is given (in-place), the output
+    file if it is an existing file, otherwise src mirrored under the output directory.
+    """
+    if not output_path:
+        return src  # overwrite
+
+    # If output is a directory (or doesn't exist yet), mirror structure
+    if output_path.exists() and output_path.is_file():
+        return output_path
+    base_src_parent = input_path if input_path.is_dir() else src.parent
+    try:
+        relative = src.relative_to(base_src_parent)
+    except Exception:
+        relative = src.name
+    return output_path / relative
 
 
 def ensure_parent_dirs(path: Path) -> None:
@@ -188,6 +523,129 @@ def ensure_parent_dirs(path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
+# ----------------------------
+# Per-file processing
+# ----------------------------
+
+# Worker threads for --jobs runs; reads, writes and CRCs release the GIL.
+# Only worth it when I/O blocks (cold cache, network shares): on warm local
+# files per-file dispatch costs more than it overlaps, so the default is 1.
+# See bench_clean_png_metadata.py.
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@dataclass
+class FileResult:
+    src: Path
+    dest: Path
+    n_chunks: int = 0  # chunks read
+    n_kept: int = 0  # chunks kept
+    removed: int = 0
+    data_before: int = 0  # sum of chunk data lengths as read
+    data_after: int = 0  # sum of chunk data lengths kept
+    noop: bool = False  # nothing to remove and dest is src: file left untouched
+    skipped: bool = False  # no PNG signature (e.g. mislabeled .png): not processed
+    failed_step: str = ""  # "reading" or "writing" when error is set
+    error: Optional[Exception] = None
+    warnings: List[str] = field(default_factory=list)
+
+
+def process_one(
+    src: Path,
+    input_path: Path,
+    output_path: Optional[Path],
+    backup: bool,
+    dry_run: bool,
+    verify_crc: bool,
+) -> FileResult:
+    """
+    Read, filter and write a single PNG.
+    Errors are captured in the returned FileResult instead of being raised,
+    so this can run in a worker thread while the main thread reports progress.
+    """
+    result = FileResult(src=src, dest=resolve_dest(src, input_path, output_path))
+    try:
+        # Read original chunks
+        chunks, result.data_before = read_png_chunks(src, verify_crc=verify_crc)
+    except NotPNGError:
+        result.skipped = True
+        return result
+    except Exception as e:
+        result.failed_step, result.error = "reading", e
+        return result
+
+    # Filter chunks
+    kept, result.removed, result.data_after = filter_chunks(chunks)
+    # Only counts go into the result, so the chunk lists (and any file buffer
+    # their slices pin) are freed as soon as this worker returns
+    result.n_chunks, result.n_kept = len(chunks), len(kept)
+
+    # Fast path: nothing to remove in-place, so nothing to back up or write
+    if result.removed == 0 and _same_file(src, result.dest):
+        result.noop = True
+        return result
+
+    # Backup path (if requested)
+    if backup and not dry_run:
+        backup_path = src.parent / (src.name + ".bak")
+        try:
+            shutil.copy2(src, backup_path)
+        except Exception as e:
+            result.warnings.append(f"could not backup {src} -> {backup_path}: {e}")
+
+    # Write new PNG if not dry-run
+    if not dry_run:
+        dest = result.dest
+        try:
+            ensure_parent_dirs(dest)
+            if result.removed:
+                write_png_chunks(kept, dest)
+            else:
+                # Nothing to remove: plain byte copy, no chunk rewrite
+                copy_file_fast(src, dest)
+        except Exception as e:
+            result.failed_step, result.error = "writing", e
+    return result
+
+
+def iter_results(
+    executor: Optional[Executor],
+    worker: Callable[[Path], FileResult],
+    files: List[Path],
+    max_pending: int = MAX_WORKERS,
+) -> Iterator[FileResult]:
+    """
+    Run worker over files on executor, yielding results as they complete.
+    At most max_pending files are in flight. The PREFETCH_WINDOW files beyond
+    the submit cursor are kept hinted for kernel read-ahead, so they are in the
+    page cache by the time a worker picks them up.
+    With no executor, files are processed in order on the calling thread.
+    """
+    # Keep a window of upcoming files being read ahead by the kernel
+    for upcoming in files[:PREFETCH_WINDOW]:
+        prefetch_file(upcoming)
+
+    if executor is None:
+        # Sequential: no per-file dispatch cost, which wins on small cached files
+        for idx, src in enumerate(files):
+            if idx + PREFETCH_WINDOW < len(files):
+                prefetch_file(files[idx + PREFETCH_WINDOW])
+            yield worker(src)
+        return
+
+    pending: Set[Future] = set()
+    for idx, src in enumerate(files):
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+        if idx + PREFETCH_WINDOW < len(files):
+            prefetch_file(files[idx + PREFETCH_WINDOW])
+        pending.add(executor.submit(worker, src))
+    for fut in as_completed(pending):
+        yield fut.result()
+
+
 # ----------------------------
 # Notepad append (learnings)
 # ----------------------------
@@ -203,12 +661,6 @@ def append_to_notepad(log_lines: List[str]) -> None:
     NOTEPAD_BASE.mkdir(parents=True, exist_ok=True)
     target = NOTEPAD_BASE / "learnings.md"
 
-    # Read existing contents if any
-    try:
-        existing = target.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        existing = ""
-
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
     addition = [
         f"## PNG metadata cleanup run — {timestamp}",
@@ -216,8 +668,9 @@ def append_to_notepad(log_lines: List[str]) -> None:
         *log_lines,
         "",
     ]
-    new_content = existing + "\n" + "\n".join(addition)
-    target.write_text(new_content, encoding="utf-8")
+    # Append only the new entry; earlier contents are never re-read or rewritten
+    with target.open("a", encoding="utf-8") as f:
+        f.write("\n" + "\n".join(addition))
 
 
 # ----------------------------
@@ -242,6 +695,11 @@ def main():
     parser.add_argument("--recursive", action="store_true", help="Recursively process subdirectories (when input is a directory).")
     parser.add_argument("--backup", action="store_true", help="Backup original PNG files before overwriting.")
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without writing any files.")
+    parser.add_argument("--verify-crc", action="store_true", help="Verify the CRC of every chunk while reading.")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help=f"Number of files processed in parallel (default: 1, no thread pool). Try {MAX_WORKERS} on slow or network storage.",
+    )
 
     args = parser.parse_args()
 
@@ -250,6 +708,11 @@ def main():
     recursive = bool(args.recursive)
     backup = bool(args.backup)
     dry_run = bool(args.dry_run)
+    verify_crc = bool(args.verify_crc)
+    jobs = args.jobs
+    if jobs < 1:
+        print(f"ERROR: --jobs must be at least 1, got {jobs}.")
+        sys.exit(2)
 
     # Gather PNGs
     files = collect_png_files(input_path, recursive)
@@ -259,80 +722,70 @@ def main():
 
     total = len(files)
     processed = 0
+    skipped = 0
     total_removed = 0
     total_before = 0
     total_after = 0
     per_file_logs: List[str] = []
 
-    start_time = time.time()
+    # If output is a file path (ends with .png/.PNG) and there are multiple inputs, error
+    if output_path and output_path.suffix.lower() in {".png"} and total > 1:
+        print(f"ERROR: multiple input files but output path {output_path} looks like a single file.")
+        sys.exit(2)
 
-    for idx, src in enumerate(files, start=1):
-        rel_src = src.name
-        try:
-            # Read original chunks
-            chunks = read_png_chunks(src)
-        except Exception as e:
-            print(f"[{idx}/{total}] ERROR reading {src}: {e}")
-            per_file_logs.append(f"- {src}: READ ERROR: {e}")
-            continue
+    start_time = time.time()
 
-        # Backup path (if requested)
-        if backup and not dry_run:
-            backup_path = src.parent / (src.name + ".bak")
-            try:
-                shutil.copy2(src, backup_path)
-            except Exception as e:
-                print(f"[{idx}/{total}] WARNING: could not backup {src} -> {backup_path}: {e}")
-
-        # Filter chunks
-        kept, removed = filter_chunks(chunks)
-        total_before += sum(ch.length for ch in chunks) + 12 * len(chunks)
-        total_after += sum(ch.length for ch in kept) + 12 * len(kept)
-        total_removed += removed
-
-        # Prepare destination
-        if output_path:
-            # If output is a file path (ends with .png/.PNG) and there are multiple inputs, error
-            if output_path.suffix.lower() in {".png"} and total > 1:
-                print(f"ERROR: multiple input files but output path {output_path} looks like a single file.")
-                sys.exit(2)
-
-            # If output is a directory (or doesn't exist yet), mirror structure
-            if output_path.exists() and output_path.is_file():
-                dest = output_path
-            else:
-                base_src_parent = input_path if input_path.is_dir() else src.parent
-                try:
-                    relative = src.relative_to(base_src_parent)
-                except Exception:
-                    relative = src.name
-                dest = output_path / relative
-        else:
-            dest = src  # overwrite
+    worker = partial(
+        process_one,
+        input_path=input_path,
+        output_path=output_path,
+        backup=backup,
+        dry_run=dry_run,
+        verify_crc=verify_crc,
+    )
+    # A pool only pays off with more than one file to overlap
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 and total > 1 else nullcontext()
+    with pool as executor:
+        for idx, result in enumerate(iter_results(executor, worker, files, max_pending=jobs), start=1):
+            src, dest = result.src, result.dest
+            for warning in result.warnings:
+                print(f"[{idx}/{total}] WARNING: {warning}")
+
+            if result.skipped:
+                print(f"[{idx}/{total}] SKIP {src}: not a valid PNG file (bad signature)")
+                per_file_logs.append(f"- {src}: SKIPPED: not a valid PNG file")
+                skipped += 1
+                continue
 
-        if not dry_run:
-            ensure_parent_dirs(dest)
-        # Write new PNG if not dry-run
-        if not dry_run:
-            try:
-                write_png_chunks(kept, dest)
-            except Exception as e:
-                print(f"[{idx}/{total}] ERROR writing {dest}: {e}")
-                per_file_logs.append(f"- {src}: WRITE ERROR: {e}")
+            if result.failed_step == "reading":
+                print(f"[{idx}/{total}] ERROR reading {src}: {result.error}")
+                per_file_logs.append(f"- {src}: READ ERROR: {result.error}")
                 continue
 
-        # Progress
-        percent = int((idx / total) * 100)
-        print(f"[{idx}/{total}] {src} -> {dest} | removed: {removed} chunks | size: {human_bytes(sum(ch.length for ch in chunks))} -> {human_bytes(sum(ch.length for ch in kept))} | {percent}%")
+            removed = result.removed
+            # Chunk stream sizes: payloads plus 12 bytes (length, type, CRC) per chunk
+            before_sz = result.data_before + 12 * result.n_chunks
+            after_sz = result.data_after + 12 * result.n_kept
+            total_before += before_sz
+            total_after += after_sz
+            total_removed += removed
+
+            if result.failed_step == "writing":
+                print(f"[{idx}/{total}] ERROR writing {dest}: {result.error}")
+                per_file_logs.append(f"- {src}: WRITE ERROR: {result.error}")
+                continue
 
-        processed += 1
-        total_before = 0
-        total_after = 0
-        per_file_logs.append(f"- {src}: removed {removed} metadata chunk(s)")
+            # Progress
+            percent = int((idx / total) * 100)
+            if result.noop:
+                print(f"[{idx}/{total}] {src} | no-op: no metadata chunks | size: {human_bytes(before_sz)} | {percent}%")
+                processed += 1
+                per_file_logs.append(f"- {src}: no metadata chunks, left unchanged")
+                continue
+            print(f"[{idx}/{total}] {src} -> {dest} | removed: {removed} chunks | size: {human_bytes(before_sz)} -> {human_bytes(after_sz)} | {percent}%")
 
-        # Show a tiny live progress indicator
-        # (no external libs; simple inline update)
-        # (We already print per-file line above.)
+            processed += 1
+            per_file_logs.append(f"- {src}: removed {removed} metadata chunk(s)")
 
     elapsed = time.time() - start_time
 
@@ -340,7 +793,9 @@ def main():
     print("\nSummary:")
     print(f"  Total input PNGs: {total}")
     print(f"  Processed: {processed}")
+    print(f"  Skipped (not a valid PNG): {skipped}")
     print(f"  Total metadata chunks removed: {total_removed}")
+    print(f"  Total size: {human_bytes(total_before)} -> {human_bytes(total_after)}")
     print(f"  Time elapsed: {elapsed:.2f}s")
     print(f"  Dry-run: {'Yes' if dry_run else 'No'}")
 
@@ -353,8 +808,11 @@ def main():
             f"- Recursive: {recursive}",
             f"- Backup: {backup}",
             f"- Dry-run: {dry_run}",
+            f"- Verify CRC: {verify_crc}",
             f"- PNGs processed: {total}",
+            f"- Skipped (not a valid PNG): {skipped}",
             f"- Metadata chunks removed: {total_removed}",
+            f"- Total size: {human_bytes(total_before)} -> {human_bytes(total_after)}",
             "",
             "Notes: This run preserves core PNG chunks (IHDR, PLTE, IDAT, IEND). All other non-metadata chunks are kept to avoid unwanted data loss unless explicitly dropped by DROP_CHUNKS.",
         ]